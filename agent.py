@@ -3,17 +3,23 @@
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import json
 import logging
 import os
 import re
+import sys
+import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, List, Optional
 
-import requests
-from jinja2 import Environment, FileSystemLoader, StrictUndefined
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from lakera import LakeraAgent, LakeraAgentError
 
@@ -30,18 +36,39 @@ DEFAULT_INTERACTIONS_LOG = Path(
 ).expanduser()
 
 
-@dataclass
+def _dumps_bytes(obj: object) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # Compact separators plus raw UTF-8 (no \uXXXX escapes) shave ~5-10% off
+    # every transcript line and request body; orjson does both by default.
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+@dataclass(frozen=True, slots=True)
 class ParsedAction:
     tag: str
     content: str
 
 
 class PromptRenderer:
-    """Thin wrapper around Jinja2 for the main attack prompt."""
+    """Thin wrapper around Jinja2 for the main attack prompt.
+
+    If the template contains the ``cache-boundary`` comment marker, the part
+    above it (which only depends on the level description) is rendered once
+    per description and reused across rounds; only the transcript tail is
+    re-rendered each round.
+    """
+
+    SPLIT_MARKER = "{# cache-boundary"
 
     def __init__(self, template_path: Path) -> None:
         if not template_path.exists():
             raise FileNotFoundError(f"Prompt template not found: {template_path}")
+        # Deferred: jinja2 costs hundreds of ms at import and is only needed
+        # once an agent is actually constructed (not for --help).
+        from jinja2 import Environment, FileSystemLoader, StrictUndefined
+
         self._env = Environment(
             loader=FileSystemLoader(str(template_path.parent)),
             autoescape=False,
@@ -50,33 +77,84 @@ class PromptRenderer:
             lstrip_blocks=True,
         )
         self._template = self._env.get_template(template_path.name)
+        self._head = None
+        self._tail = None
+        self._head_cache: Optional[tuple[str, str]] = None
+        source = template_path.read_text(encoding="utf-8")
+        if self.SPLIT_MARKER in source:
+            head_source, tail_source = source.split(self.SPLIT_MARKER, 1)
+            tail_source = tail_source.split("#}", 1)[1]
+            self._head = self._env.from_string(head_source)
+            self._tail = self._env.from_string(tail_source)
 
     def render(self, *, description: str, turns: List[Dict[str, str]], guidance: Optional[str]) -> str:
-        return self._template.render(description=description, turns=turns, guidance=guidance)
+        if self._head is None or self._tail is None:
+            return self._template.render(description=description, turns=turns, guidance=guidance)
+        cached = self._head_cache
+        if cached is None or cached[0] != description:
+            cached = (description, self._head.render(description=description))
+            self._head_cache = cached
+        return cached[1] + self._tail.render(turns=turns, guidance=guidance)
 
 
 class TranscriptLogger:
-    """JSONL logger so each agent step can be replayed later."""
+    """JSONL logger so each agent step can be replayed later.
+
+    Keeps a single buffered append handle open for the lifetime of the run.
+    Events are staged in memory and written as one writelines() batch per
+    flush, so a round's worth of events costs a single buffered write.
+    """
+
+    FLUSH_EVERY = 64
 
     def __init__(self, path: Path) -> None:
         self._path = path
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self._path.open("ab", buffering=1 << 16)
+        self._pending: List[bytes] = []
+        self._ts_second = -1
+        self._ts_prefix = ""
 
     def _timestamp(self) -> str:
-        return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+        # Bursty logging emits many events within the same second; cache the
+        # strftime portion and only reformat the milliseconds per event.
+        seconds, rem = divmod(time.time_ns(), 1_000_000_000)
+        if seconds != self._ts_second:
+            self._ts_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+            self._ts_second = seconds
+        return f"{self._ts_prefix}.{rem // 1_000_000:03d}Z"
 
     def log(self, event: str, **payload: object) -> None:
+        if self._handle.closed:
+            return
         entry = {"timestamp": self._timestamp(), "event": event}
         entry.update(payload)
-        with self._path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(entry) + "\n")
+        self._pending.append(_dumps_bytes(entry) + b"\n")
+        if len(self._pending) >= self.FLUSH_EVERY or event == "run_complete":
+            self.flush()
+
+    def flush(self) -> None:
+        if self._handle.closed:
+            self._pending.clear()
+            return
+        if self._pending:
+            self._handle.writelines(self._pending)
+            self._pending.clear()
+        self._handle.flush()
+
+    def close(self) -> None:
+        if not self._handle.closed:
+            self.flush()
+            self._handle.close()
 
 
 class GandalfAutoAgent:
     """Coordinates Lakera, the prompt template, OpenRouter, and transcript logging."""
 
+    # Positional groups: group access hits a C array instead of the named-group
+    # dict lookup, which matters when scanning long LLM responses.
     TAG_PATTERN = re.compile(
-        r"<(?P<tag>prompt|password)>(?P<body>.*?)</(?P=tag)>",
+        r"<(prompt|password)>(.*?)</\1>",
         re.IGNORECASE | re.DOTALL,
     )
 
@@ -110,18 +188,59 @@ class GandalfAutoAgent:
         run_id = now.strftime("%Y-%m-%dT%H-%M-%S")
         transcript_path = transcript_dir / f"transcript-{run_id}.jsonl"
         self._logger = TranscriptLogger(transcript_path)
-        self._turns: List[Dict[str, str]] = []
+        # maxlen=None when history is unlimited; eviction is O(1) either way.
+        self._turns: deque[Dict[str, str]] = deque(maxlen=self._history_limit or None)
+        import requests  # deferred with jinja2; see PromptRenderer.__init__
+
         self._http = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=requests.adapters.Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=None,
+            ),
+        )
+        self._http.mount("https://", adapter)
+        if self._openrouter_api_key:
+            self._http.headers["Authorization"] = f"Bearer {self._openrouter_api_key}"
+        self._http.headers["Content-Type"] = "application/json"
         referer_header = openrouter_referer or os.getenv("OPENROUTER_REFERER")
         title_header = openrouter_title or os.getenv("OPENROUTER_TITLE")
         if referer_header:
             self._http.headers["HTTP-Referer"] = referer_header
         if title_header:
             self._http.headers["X-Title"] = title_header
+        # Optional httpx client: one multiplexed HTTP/2 connection across
+        # rounds when httpx (and h2) are installed; requests otherwise. Built
+        # after the headers above so it inherits the complete set.
+        self._httpx = None
+        try:
+            import httpx
+        except ImportError:
+            pass
+        else:
+            http2 = importlib.util.find_spec("h2") is not None
+            self._httpx = httpx.Client(
+                http2=http2,
+                timeout=self._http_timeout,
+                headers=dict(self._http.headers),
+            )
         self._latest_url_path = latest_url_path
+        self._latest_parent_ready = False
 
-    def run(self, *, max_rounds: int = 10) -> None:
+    def _run(self, *, max_rounds: int = 10) -> None:
         LOG.info("Starting GandalfAutoAgent run; max_rounds=%d", max_rounds)
+        # Pre-bind hot attribute chains once; LOAD_FAST beats
+        # LOAD_GLOBAL/LOAD_ATTR pairs inside the per-round loop.
+        log = self._logger.log
+        render = self._renderer.render
+        call_openrouter = self._call_openrouter
+        extract_actions = self._extract_actions
+        handle_prompt = self._handle_prompt_action
+        handle_password = self._handle_password_action
         with LakeraAgent(**self._lakera_kwargs) as lakera:
             level_number = 1
             LOG.debug("Fetching level %d description via Lakera", level_number)
@@ -140,29 +259,25 @@ class GandalfAutoAgent:
                     description = self._load_level_description(lakera, level_number, active=True)
                     description_level = level_number
                 LOG.info("Round %d/%d (level %d)", round_idx, max_rounds, level_number)
-                llm_prompt = self._renderer.render(description=description, turns=self._turns, guidance=self._guidance)
+                llm_prompt = render(description=description, turns=self._turns, guidance=self._guidance)
                 LOG.debug("Rendered template characters=%d", len(llm_prompt))
-                print("\n===== OpenRouter Prompt (round", round_idx, ", level", level_number, ") =====")
-                print(llm_prompt)
-                print("===== End Prompt =====\n")
-                self._logger.log("llm_prompt", round=round_idx, prompt=llm_prompt, level=level_number)
-                llm_response = self._call_openrouter(llm_prompt)
+                self._dump_console(f"OpenRouter Prompt (round {round_idx}, level {level_number})", llm_prompt)
+                log("llm_prompt", round=round_idx, prompt=llm_prompt, level=level_number)
+                llm_response = call_openrouter(llm_prompt)
                 LOG.debug("OpenRouter response length=%d", len(llm_response))
-                print("===== OpenRouter Response (round", round_idx, ", level", level_number, ") =====")
-                print(llm_response)
-                print("===== End Response =====\n")
-                self._logger.log("llm_response", round=round_idx, response=llm_response, level=level_number)
-                actions = self._extract_actions(llm_response)
+                self._dump_console(f"OpenRouter Response (round {round_idx}, level {level_number})", llm_response)
+                log("llm_response", round=round_idx, response=llm_response, level=level_number)
+                actions = extract_actions(llm_response)
                 if not actions:
                     LOG.warning("Round %d produced no actionable XML tags", round_idx)
-                    self._logger.log("no_actions", round=round_idx, response=llm_response, level=level_number)
+                    log("no_actions", round=round_idx, response=llm_response, level=level_number)
                     break
                 advanced_level = False
                 for action in actions:
                     if action.tag == "prompt":
-                        self._handle_prompt_action(lakera, action.content, round_idx, level_number)
+                        handle_prompt(lakera, action.content, round_idx, level_number)
                     elif action.tag == "password":
-                        if self._handle_password_action(lakera, action.content, round_idx, level_number):
+                        if handle_password(lakera, action.content, round_idx, level_number):
                             LOG.info("Password accepted for level %d", level_number)
                             level_number += 1
                             description = self._load_level_description(lakera, level_number, active=True)
@@ -170,49 +285,97 @@ class GandalfAutoAgent:
                             self._turns.clear()
                             advanced_level = True
                             break
+                self._logger.flush()
                 if advanced_level:
                     continue
             LOG.info("Run complete; rounds=%d levels_reached=%d", rounds_executed, level_number)
-            self._logger.log("run_complete", rounds=rounds_executed, level=level_number)
+            log("run_complete", rounds=rounds_executed, level=level_number)
+
+    def run(self, *, max_rounds: int = 10) -> None:
+        try:
+            self._run(max_rounds=max_rounds)
+        finally:
+            self._logger.flush()
+
+    @staticmethod
+    def _dump_console(title: str, body: str) -> None:
+        # Multi-KB dumps sit on the critical path between the LLM call and the
+        # Lakera submission; only pay the stdout I/O when debugging.
+        if LOG.isEnabledFor(logging.DEBUG):
+            sys.stdout.write(f"\n===== {title} =====\n{body}\n===== End =====\n\n")
 
     def _call_openrouter(self, prompt: str) -> str:
         if not self._openrouter_api_key:
             raise RuntimeError("OpenRouter API key is missing. Set OPENROUTER_API_KEY or pass openrouter_api_key explicitly.")
-        headers = {
-            "Authorization": f"Bearer {self._openrouter_api_key}",
-            "Content-Type": "application/json",
-        }
         payload = {
             "model": self._openrouter_model,
+            "stream": True,
             "messages": [
                 {"role": "user", "content": prompt},
             ],
         }
         LOG.debug("Calling OpenRouter model=%s", self._openrouter_model)
-        response = self._http.post(
-            "https://openrouter.ai/api/v1/chat/completions",
-            headers=headers,
-            data=json.dumps(payload),
-            timeout=self._http_timeout,
-        )
-        response.raise_for_status()
-        data = response.json()
-        choices = data.get("choices") or []
-        if not choices:
-            raise RuntimeError("OpenRouter response did not include any choices")
-        message = choices[0].get("message") or {}
-        content = message.get("content")
+        # Accumulate SSE deltas as they arrive and stop reading as soon as a
+        # complete action tag is present, overlapping network tail with work.
+        content = ""
+        search = self.TAG_PATTERN.search
+        lines = self._stream_completion_lines(_dumps_bytes(payload))
+        try:
+            for raw_line in lines:
+                if not raw_line or not raw_line.startswith("data:"):
+                    continue
+                data = raw_line[5:].strip()
+                if data == "[DONE]":
+                    break
+                try:
+                    chunk = json.loads(data)
+                except ValueError:
+                    continue
+                choices = chunk.get("choices") or []
+                if not choices:
+                    continue
+                delta = choices[0].get("delta") or {}
+                piece = delta.get("content")
+                if not piece:
+                    continue
+                content += piece
+                if "</" in piece and search(content):
+                    LOG.debug("Complete action tag observed; aborting stream early")
+                    break
+        finally:
+            lines.close()
         if not content:
             raise RuntimeError("OpenRouter response choice was missing content")
         return content
 
+    def _stream_completion_lines(self, body: bytes):
+        """Yield SSE lines from the completions endpoint, via httpx or requests.
+
+        ``body`` is already UTF-8 bytes, so both transports hand it to the
+        socket as-is instead of str-encoding a json.dumps result a second
+        time.
+        """
+        url = "https://openrouter.ai/api/v1/chat/completions"
+        if self._httpx is not None:
+            with self._httpx.stream("POST", url, content=body) as response:
+                response.raise_for_status()
+                yield from response.iter_lines()
+            return
+        response = self._http.post(url, data=body, timeout=self._http_timeout, stream=True)
+        try:
+            response.raise_for_status()
+            yield from response.iter_lines(decode_unicode=True)
+        finally:
+            response.close()
+
     def _extract_actions(self, llm_response: str) -> List[ParsedAction]:
         actions: List[ParsedAction] = []
+        append = actions.append
         for match in self.TAG_PATTERN.finditer(llm_response):
-            tag = match.group("tag").lower()
-            body = match.group("body").strip()
+            tag, body = match.group(1, 2)
+            body = body.strip()
             if body:
-                actions.append(ParsedAction(tag=tag, content=body))
+                append(ParsedAction(tag=tag.lower(), content=body))
         if not actions:
             snippet = llm_response[:200].replace("\n", " ")
             LOG.debug("No XML tags found in response snippet=%r", snippet)
@@ -306,14 +469,14 @@ class GandalfAutoAgent:
 
     def _append_turn(self, role: str, content: str) -> None:
         self._turns.append({"role": role, "content": content})
-        if self._history_limit and len(self._turns) > self._history_limit:
-            self._turns = self._turns[-self._history_limit :]
 
     def _persist_latest_url(self, url: str) -> None:
         if not self._latest_url_path:
             return
         try:
-            self._latest_url_path.parent.mkdir(parents=True, exist_ok=True)
+            if not self._latest_parent_ready:
+                self._latest_url_path.parent.mkdir(parents=True, exist_ok=True)
+                self._latest_parent_ready = True
             self._latest_url_path.write_text(url, encoding="utf-8")
             LOG.info("Saved next level URL to %s", self._latest_url_path)
         except OSError as exc:
@@ -411,6 +574,8 @@ def main() -> None:
     except LakeraAgentError as exc:
         agent._logger.log("lakera_error", error=str(exc))
         raise
+    finally:
+        agent._logger.close()
 
 
 if __name__ == "__main__":
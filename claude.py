@@ -1,14 +1,64 @@
-import anthropic
+import functools
 import os
-import re
+import string
+
+# ASCII-only lowercasing for the tag scan: unlike str.lower(), translate with
+# this table is length-preserving for every input (e.g. "İ".lower() is two
+# characters), so indexes found in the lowered copy stay valid in the
+# original message. The tags themselves are plain ASCII.
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _find_tag(message, lowered, tag):
+    """Extract the body of <tag>...</tag> with plain str.find.
+
+    For a single fixed-literal tag this beats the regex engine: str.find is a
+    C-level substring scan. `lowered` is message.translate(_ASCII_LOWER),
+    computed once by the caller so both tags share the case-insensitive scan.
+    """
+    open_tag = f"<{tag}>"
+    close_tag = f"</{tag}>"
+    i = lowered.find(open_tag)
+    if i < 0:
+        return None
+    i += len(open_tag)
+    j = lowered.find(close_tag, i)
+    if j < 0:
+        return None
+    return message[i:j].strip()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_prompt(filename):
+    """Read (and cache) a static prompt file; the content never changes mid-run."""
+    try:
+        with open(filename, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Initial prompt file not found: {filename}")
+
+@functools.lru_cache(maxsize=None)
+def _shared_client():
+    """One Anthropic client per process.
+
+    The client owns an HTTP connection pool; sharing it across agents reuses
+    warm TLS connections instead of paying a handshake per construction.
+    """
+    import anthropic  # deferred: the SDK import dominates module load time
+
+    return anthropic.Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_agent(model):
+    """Process-wide ClaudeAgent for a given model, backed by the shared client."""
+    return ClaudeAgent(model)
+
 
 class ClaudeAgent(object):
 
     def __init__(self, model):
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
-        self.client = anthropic.Anthropic(
-            api_key = api_key
-        )
+        self.client = _shared_client()
         self.messages = []
         self.model = model
         #self.first = True
@@ -25,12 +75,7 @@ class ClaudeAgent(object):
         """
         self.success = False
         if self.first:
-            try:
-                with open(filename, "r", encoding="utf-8") as f:
-                    prompt_text = f.read().strip()
-
-            except FileNotFoundError:
-                raise FileNotFoundError(f"Initial prompt file not found: {filename}")
+            prompt_text = _load_prompt(filename)
         self.first = False
         prompt_text += '\n' + task_description
         self.messages.insert(0, {"role": "user", "content": prompt_text})
@@ -42,11 +87,7 @@ class ClaudeAgent(object):
         """
         self.success = False
         self.messages = []
-        try:
-            with open(filename, "r", encoding="utf-8") as f:
-                prompt_text = f.read().strip()
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Initial prompt file not found: {filename}")
+        prompt_text = _load_prompt(filename)
         prompt_text += '\n' + task_description
         self.messages.insert(0, {"role": "user", "content": prompt_text})
 
@@ -58,23 +99,20 @@ class ClaudeAgent(object):
             temperature=1,
             messages=self.messages
         )
-        print(output)
         message = output.content[0].text
         print("[claude] Model output:" + message)
         self.messages.append({"role": "assistant", "content": message})
 
-        m_prompt = re.search(r"<prompt>(.*?)</prompt>", message, flags=re.IGNORECASE | re.DOTALL)
-        m_password = re.search(r"<password>(.*?)</password>", message, flags=re.IGNORECASE | re.DOTALL)
-        if m_prompt:
-            prompt_val = m_prompt.group(1).strip()
-            self.prompt = prompt_val 
-            return "prompt"       
-        elif m_password:
-            password_val = m_password.group(1).strip()
+        lowered = message.translate(_ASCII_LOWER)
+        prompt_val = _find_tag(message, lowered, "prompt")
+        if prompt_val is not None:
+            self.prompt = prompt_val
+            return "prompt"
+        password_val = _find_tag(message, lowered, "password")
+        if password_val is not None:
             self.password = password_val
             return "password"
-        else:
-            raise RuntimeError(f"Model did not produce <prompt> or <password> tag.")
+        raise RuntimeError(f"Model did not produce <prompt> or <password> tag.")
 
     def process_lakera_output(self, answer=None, check=None):
         """
@@ -98,4 +136,5 @@ class ClaudeAgent(object):
             tagged = f"<check>{message}</check>"
             self.messages.append({"role": "user", "content": tagged})
             extracted.append(("check", inner))
+        return extracted
 
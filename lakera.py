@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import json
 import os
+import queue
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from shutil import which
-from typing import Iterable, Optional
-from datetime import datetime
-import time
+from typing import BinaryIO, ClassVar, Iterable, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # stdlib json remains the fallback
+    orjson = None
 
+from paths import userdata_paths
 from selenium import webdriver
 from selenium.common.exceptions import (
     ElementClickInterceptedException,
@@ -29,10 +40,111 @@ class LakeraAgentError(RuntimeError):
     """General failure interacting with the Lakera page."""
 
 
-DEFAULT_USERDATA_DIR = Path(os.getenv("USERDATA_DIR", "userdata")).expanduser()
-DEFAULT_LOG_PATH = Path(
-    os.getenv("LAKERA_INTERACTIONS", str(DEFAULT_USERDATA_DIR / "interactions.jsonl"))
-).expanduser()
+# Locator tuples used inside waits and polling loops, built once here instead
+# of on every lookup.
+_DESCRIPTION_LOCATOR = (By.CSS_SELECTOR, "p.description")
+_PROMPT_ERROR_LOCATOR = (By.CSS_SELECTOR, "p.text-red-500, p[class*='text-red']")
+_CUSTOM_ALERT_LOCATOR = (By.CSS_SELECTOR, "div.customAlert")
+
+
+@lru_cache(maxsize=8)
+def _load_json_snapshot(path_str: str, mtime_ns: int):
+    """Parse a JSON state file, cached by (path, mtime).
+
+    Callers must treat the result as read-only; the mtime key invalidates the
+    entry whenever the file is rewritten.
+    """
+    try:
+        return json.loads(Path(path_str).read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def _read_json_state(path: Path):
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return _load_json_snapshot(str(path), stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=2)
+def _utc_second_str(seconds: int) -> str:
+    """Format the whole-second part of a UTC timestamp; cached so the strftime
+    call runs at most once per second of logged events."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+
+def _utc_timestamp_ms() -> str:
+    seconds, rem = divmod(time.time_ns(), 1_000_000_000)
+    return f"{_utc_second_str(seconds)}.{rem // 1_000_000:03d}Z"
+
+
+def _write_snapshot(path: Path, data: bytes) -> None:
+    """Atomically replace a JSON snapshot file.
+
+    Writing to a sibling temp file and os.replace-ing it means a crash
+    mid-write can never leave a truncated cookies/storage file behind.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as handle:
+        handle.write(data)
+    os.replace(tmp_path, path)
+
+
+# Storage snapshots are persisted as a full base file plus an append-only
+# delta log of {section, key, value} ops; small changes append a few lines
+# instead of rewriting the whole snapshot.
+STORAGE_DELTA_MAX_OPS = 16
+STORAGE_DELTA_COMPACT_BYTES = 256 * 1024
+
+
+def _storage_delta_path(path: Path) -> Path:
+    return path.with_name(path.name + ".delta.jsonl")
+
+
+def _read_storage_state(path: Path):
+    """Load a storage snapshot: the base file with any delta ops applied."""
+    base = _read_json_state(path)
+    try:
+        lines = _storage_delta_path(path).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return base
+    merged = {
+        "local": dict((base or {}).get("local") or {}),
+        "session": dict((base or {}).get("session") or {}),
+    }
+    for line in lines:
+        try:
+            op = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        section = merged.setdefault(op.get("section", "local"), {})
+        key = op.get("key")
+        if op.get("value") is None:
+            section.pop(key, None)
+        else:
+            section[key] = op["value"]
+    return merged
+
+
+def _diff_storage(old: dict, new: dict) -> list:
+    """Ops ({section, key, value}; value None deletes) turning old into new."""
+    ops = []
+    for section in ("local", "session"):
+        old_map = (old or {}).get(section) or {}
+        new_map = (new or {}).get(section) or {}
+        for key, value in new_map.items():
+            if old_map.get(key) != value:
+                ops.append({"section": section, "key": key, "value": value})
+        for key in old_map:
+            if key not in new_map:
+                ops.append({"section": section, "key": key, "value": None})
+    return ops
+
+
+DEFAULT_USERDATA_DIR = userdata_paths().userdata_dir
+DEFAULT_LOG_PATH = userdata_paths().log_path
 EMPTY_ANSWER_GRACE_SECONDS = float(os.getenv("LAKERA_EMPTY_ANSWER_GRACE", "2"))
 EMPTY_ANSWER_POLL_SECONDS = float(os.getenv("LAKERA_EMPTY_ANSWER_POLL", "0.2"))
 PROMPT_SUBMIT_MAX_ATTEMPTS = max(1, int(os.getenv("LAKERA_PROMPT_ATTEMPTS", "2")))
@@ -40,11 +152,101 @@ PROMPT_SUBMIT_RETRY_DELAY = float(os.getenv("LAKERA_PROMPT_RETRY_DELAY", "1.0"))
 PROMPT_POST_SUBMIT_DELAY = float(os.getenv("LAKERA_PROMPT_POST_DELAY", "0.3"))
 PASSWORD_WARMUP_PROMPT = os.getenv("LAKERA_PASSWORD_WARMUP", "Hello Gandalf!" )
 PASSWORD_WARMUP_ATTEMPTS = max(1, int(os.getenv("LAKERA_PASSWORD_WARMUP_ATTEMPTS", "2")))
+# Characters outside the Basic Multilingual Plane, stripped before send_keys.
+_NON_BMP_RE = re.compile("[^\\u0000-\\uffff]")
+
+LOG_BUFFER_BYTES = 64 * 1024
+LOG_FLUSH_EVERY = max(1, int(os.getenv("LAKERA_LOG_FLUSH_EVERY", "32")))
+LOG_FLUSH_INTERVAL = float(os.getenv("LAKERA_LOG_FLUSH_INTERVAL", "0.25"))
+
+# Reused across every _log_event call; json.dumps builds a fresh encoder per
+# call, and the compact separators/raw unicode keep the lines smaller too.
+_LOG_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+if orjson is not None:
+    def _dump_json_bytes(obj) -> bytes:
+        # orjson emits compact UTF-8 bytes directly, several times faster
+        # than the stdlib encoder on these dict-of-strings payloads.
+        return orjson.dumps(obj)
+else:
+    def _dump_json_bytes(obj) -> bytes:
+        return _LOG_ENCODER.encode(obj).encode("utf-8")
+
+
+class InteractionLogger:
+    """Buffered JSONL writer, one process-wide instance per log path.
+
+    Agents that log to the same file (pool workers, shared-browser tabs) share
+    a single buffered handle instead of interleaving their own, so events cost
+    a buffer append rather than a syscall each. Flushes are debounced by event
+    count and interval, and an atexit hook lands the tail on interpreter exit.
+    """
+
+    _instances: ClassVar[dict[str, "InteractionLogger"]] = {}
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._handle: Optional[BinaryIO] = None
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        # Belt-and-braces: buffered log lines survive interpreter exit even if
+        # close() never runs (Ctrl-C mid-run, unhandled exception in a script).
+        atexit.register(self.flush)
+
+    @classmethod
+    def for_path(cls, path: Path) -> "InteractionLogger":
+        key = str(path)
+        with cls._instances_lock:
+            logger = cls._instances.get(key)
+            if logger is None:
+                logger = cls._instances[key] = cls(path)
+        return logger
+
+    def emit(self, entry: dict) -> None:
+        try:
+            with self._lock:
+                if self._handle is None:
+                    self._path.parent.mkdir(parents=True, exist_ok=True)
+                    self._handle = self._path.open("ab", buffering=LOG_BUFFER_BYTES)
+                # Two writes into the 64KB buffer beat concatenating a new
+                # bytes object per event just to tack on the newline.
+                write = self._handle.write
+                write(_dump_json_bytes(entry))
+                write(b"\n")
+                self._unflushed += 1
+                # Flush on whichever trips first: the event-count threshold or
+                # the debounce interval, so sparse events still land promptly.
+                if (
+                    self._unflushed >= LOG_FLUSH_EVERY
+                    or time.monotonic() - self._last_flush >= LOG_FLUSH_INTERVAL
+                ):
+                    self._flush_locked()
+        except OSError:
+            pass
+
+    def _flush_locked(self) -> None:
+        self._last_flush = time.monotonic()
+        self._unflushed = 0
+        if self._handle is not None:
+            try:
+                self._handle.flush()
+            except OSError:
+                pass
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
 
 
 class LakeraAgent:
     """Wraps a Selenium session to fetch descriptions, prompts, and password guesses."""
 
+    _cached_browser_binary: ClassVar[Optional[str]] = None
+    # One Chrome shared by every agent created through new_tab().
+    _shared_driver: ClassVar[Optional[webdriver.Chrome]] = None
+
     def __init__(
         self,
         *,
@@ -56,6 +258,9 @@ class LakeraAgent:
         log_path: Optional[Path] = None,
         storage_path: Optional[Path] = None,
         page_load_stop_after: float = 5.0,
+        poll_interval: float = 0.1,
+        share_browser: bool = False,
+        debugger_address: Optional[str] = None,
     ) -> None:
         self._base_url = base_url
         self._cookie_jar = cookie_jar
@@ -64,57 +269,284 @@ class LakeraAgent:
         self._chrome_binary = chrome_binary
         self._log_path = Path(log_path) if log_path else DEFAULT_LOG_PATH
         self._storage_path = storage_path
+        # With pageLoadStrategy="eager" this no longer gates a manual
+        # readyState poll; it bounds the driver's page-load timeout, after
+        # which the navigation is stopped and treated as loaded-enough.
         self._page_load_stop_after = max(0.0, page_load_stop_after)
+        # Selenium's default 500ms poll leaves the agent idle long after fast
+        # responses land; poll more eagerly by default.
+        self._poll_interval = max(0.01, poll_interval)
         self._last_next_level_url: Optional[str] = None
         self._last_prompt_error: Optional[str] = None
         self._password_warmup_prompt = PASSWORD_WARMUP_PROMPT
+        self._logger = InteractionLogger.for_path(self._log_path) if self._log_path else None
+        # Serializing the cookie jar after every submission costs a
+        # get_cookies round-trip plus a file rewrite; debounce it instead.
+        self._cookies_dirty = False
+        self._submissions_since_save = 0
+        self._save_every = 50
+        self._cookie_dir_ready = False
+        self._storage_dir_ready = False
+        # blake2b digests of the last-written snapshots; unchanged state is
+        # detected cheaply and the disk write skipped entirely.
+        self._cookie_digest: Optional[bytes] = None
+        self._storage_digest: Optional[bytes] = None
+        # Last persisted storage snapshot, diffed against on save so small
+        # changes append to the delta log instead of rewriting the base file.
+        self._storage_last_saved: Optional[dict] = None
+        # Identifier of the new-document storage seed script; removed after
+        # the first navigation so the restore stays once-per-session.
+        self._seed_script_id: Optional[str] = None
+        # Located form elements, keyed by (url, selector); stale handles are
+        # detected and re-located on use.
+        self._form_cache: dict[tuple[str, str], WebElement] = {}
+        # (url, text) grabbed opportunistically right after a level change.
+        self._prefetched_description: Optional[tuple[str, str]] = None
+        # Descriptions already fetched this process, keyed by level URL;
+        # revisiting a level costs a dict lookup instead of a DOM wait.
+        self.level_descriptions: dict[str, str] = {}
+        self._share_browser = share_browser
+        self._window_handle: Optional[str] = None
+        # When set, drive an already-running Chrome instead of launching one;
+        # close() then leaves that browser alive for the next invocation.
+        self._debugger_address = debugger_address
         self._driver = self._build_driver()
-        self._wait = WebDriverWait(self._driver, self._timeout)
+        self._wait = WebDriverWait(self._driver, self._timeout, poll_frequency=self._poll_interval)
+
+    @staticmethod
+    def _enlarge_command_pool(driver: webdriver.Chrome) -> None:
+        """Widen the chromedriver HTTP connection pool (urllib3 defaults to
+        maxsize=1, which serializes interleaved WebDriver commands).
+
+        Reaches into Selenium's RemoteConnection internals, so it is strictly
+        best-effort: any layout change across Selenium versions just leaves the
+        default pool in place.
+        """
+        try:
+            pool_manager = driver.command_executor._conn
+            pool_manager.connection_pool_kw["maxsize"] = 16
+            pool_manager.connection_pool_kw["block"] = False
+            pool_manager.clear()
+        except AttributeError:
+            pass
 
     @staticmethod
     def _sanitize_sendable_text(text: str) -> tuple[str, bool]:
         """Remove characters outside the Basic Multilingual Plane (ChromeDriver limitation)."""
-        sanitized = "".join(ch for ch in text if ord(ch) <= 0xFFFF)
-        return sanitized, sanitized != text
+        sanitized = _NON_BMP_RE.sub("", text)
+        # Only removals can happen, so a length check detects any change.
+        return sanitized, len(sanitized) != len(text)
 
     def _build_driver(self) -> webdriver.Chrome:
-        binary_path = self._resolve_browser_binary()
-        options = Options()
-        if self._headless:
-            options.add_argument("--headless=new")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        if binary_path:
-            options.binary_location = binary_path
+        if self._share_browser:
+            driver = self._acquire_shared_tab()
+        else:
+            driver = self._start_chrome()
 
-        try:
-            driver = webdriver.Chrome(options=options)
-        except WebDriverException as exc:
-            raise LakeraAgentError("failed to start Chrome WebDriver") from exc
+        # Read each state file once here (a single stat + read apiece) and pass
+        # the parsed data down instead of letting every helper re-stat it.
+        saved_cookies = _read_json_state(self._cookie_jar) if self._cookie_jar else None
+        saved_storage = _read_storage_state(self._storage_path) if self._storage_path else None
+        self._storage_last_saved = saved_storage
+
+        # Seeding cookies and storage over CDP before the first get() lets the
+        # app boot already authenticated, avoiding the post-restore refresh
+        # (a full extra page load) the WebDriver path needs.
+        restored_cookies = False
+        restored_storage = False
+        if saved_cookies:
+            restored_cookies = self._seed_cookies_via_cdp(driver, saved_cookies)
+        if saved_storage:
+            restored_storage = self._seed_storage_via_cdp(driver, saved_storage)
 
         self._navigate_to(self._base_url, driver=driver)
+
+        if self._seed_script_id:
+            # Restore is once-per-session: left registered, the seed script
+            # would re-apply the boot-time snapshot to every later document
+            # (level advances, reloads), clobbering keys the app updated
+            # mid-run — and save_storage could then persist that stale state.
+            try:
+                driver.execute_cdp_cmd(
+                    "Page.removeScriptToEvaluateOnNewDocument",
+                    {"identifier": self._seed_script_id},
+                )
+            except WebDriverException:
+                pass
+            self._seed_script_id = None
+
         needs_refresh = False
-        if self._storage_path and self._storage_path.exists():
-            if self._restore_storage(driver):
+        if saved_storage and not restored_storage:
+            if self._restore_storage(driver, saved_storage):
                 needs_refresh = True
-        if self._cookie_jar and self._cookie_jar.exists():
-            self._load_cookies(driver)
+        if saved_cookies and not restored_cookies:
+            self._load_cookies(driver, saved_cookies)
             needs_refresh = True
         if needs_refresh:
-            driver.refresh()
+            # Page.reload skips Selenium's blocking load wait; every caller
+            # already waits on the element it needs, so blocking here just
+            # delays startup.
+            try:
+                driver.execute_cdp_cmd("Page.reload", {"ignoreCache": False})
+            except WebDriverException:
+                driver.refresh()
+        return driver
+
+    def _start_chrome(self) -> webdriver.Chrome:
+        options = Options()
+        if self._debugger_address:
+            # Attaching to a live Chrome: launch flags do not apply.
+            options.debugger_address = self._debugger_address
+        else:
+            binary_path = self._resolve_browser_binary()
+            if self._headless:
+                options.add_argument("--headless=new")
+            options.add_argument("--disable-gpu")
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+            if binary_path:
+                options.binary_location = binary_path
+        # Return control at DOMContentLoaded instead of waiting for every
+        # subresource — the built-in version of the readyState polling and
+        # window.stop() fallback _navigate_to used to do by hand.
+        options.page_load_strategy = "eager"
+
+        try:
+            driver = webdriver.Chrome(options=options)
+        except WebDriverException as exc:
+            raise LakeraAgentError("failed to start Chrome WebDriver") from exc
+        if self._page_load_stop_after:
+            driver.set_page_load_timeout(max(self._page_load_stop_after, self._timeout))
+        # Bounds every execute_async_script wait; set once rather than per call.
+        driver.set_script_timeout(self._timeout)
+        self._enlarge_command_pool(driver)
         return driver
 
-    def _load_cookies(self, driver: webdriver.Chrome) -> None:
-        if not self._cookie_jar or not self._cookie_jar.exists():
+    def _acquire_shared_tab(self) -> webdriver.Chrome:
+        """Attach this agent to the process-wide Chrome, opening a fresh tab.
+
+        Starting a tab costs ~50ms against the seconds a whole Chrome launch
+        takes, and gandalf sessions live in cookies rather than global JS
+        state, so tabs isolate cleanly.
+        """
+        driver = LakeraAgent._shared_driver
+        if driver is None:
+            driver = self._start_chrome()
+            LakeraAgent._shared_driver = driver
+            self._window_handle = driver.current_window_handle
+            return driver
+        before = set(driver.window_handles)
+        try:
+            driver.execute_cdp_cmd("Target.createTarget", {"url": "about:blank"})
+        except WebDriverException:
+            driver.switch_to.new_window("tab")
+        for handle in driver.window_handles:
+            if handle not in before:
+                driver.switch_to.window(handle)
+                self._window_handle = handle
+                break
+        else:
+            raise LakeraAgentError("failed to open a tab in the shared browser")
+        return driver
+
+    @classmethod
+    def new_tab(cls, **kwargs) -> "LakeraAgent":
+        """Create an agent that shares one Chrome process with its siblings."""
+        return cls(share_browser=True, **kwargs)
+
+    @classmethod
+    def attach(cls, debugger_address: str = "127.0.0.1:9222", **kwargs) -> "LakeraAgent":
+        """Drive a Chrome already running with --remote-debugging-port.
+
+        The browser outlives the agent: close() saves state and detaches
+        instead of quitting, so the next process attaches to a warm session.
+        """
+        return cls(debugger_address=debugger_address, **kwargs)
+
+    @classmethod
+    def shutdown_shared_browser(cls) -> None:
+        """Quit the process-wide Chrome once all tab agents are done."""
+        driver = cls._shared_driver
+        cls._shared_driver = None
+        if driver is not None:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+
+    def _ensure_window(self) -> None:
+        # Only tab agents pay the focus check; a dedicated driver always has
+        # exactly one window.
+        if self._window_handle is None:
             return
+        try:
+            if self._driver.current_window_handle != self._window_handle:
+                self._driver.switch_to.window(self._window_handle)
+        except WebDriverException:
+            pass
+
+    # Cookie fields the CDP Network.setCookies endpoint understands.
+    _CDP_COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+
+    def _cdp_cookie_payload(self, cookies: list) -> list:
+        payload = []
+        for cookie in cookies:
+            normalized = {key: cookie[key] for key in self._CDP_COOKIE_FIELDS if key in cookie}
+            # -1 marks a session cookie in CDP terms.
+            normalized["expires"] = int(cookie["expiry"]) if "expiry" in cookie else -1
+            normalized.setdefault("path", "/")
+            payload.append(normalized)
+        return payload
+
+    def _seed_cookies_via_cdp(self, driver: webdriver.Chrome, cookies: list) -> bool:
+        """Install the saved cookie jar before the first navigation."""
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd(
+                "Network.setCookies", {"cookies": self._cdp_cookie_payload(cookies)}
+            )
+        except WebDriverException:
+            return False
+        return True
 
+    def _seed_storage_via_cdp(self, driver: webdriver.Chrome, snapshot: dict) -> bool:
+        """Register a new-document script that seeds web storage before app JS runs."""
+        local_entries = snapshot.get("local") or {}
+        session_entries = snapshot.get("session") or {}
+        if not (local_entries or session_entries):
+            return False
+        source = (
+            "(function(ls, ss) {"
+            "  Object.keys(ls).forEach(function(k) {"
+            "    try { localStorage.setItem(k, ls[k]); } catch (_) {}"
+            "  });"
+            "  Object.keys(ss).forEach(function(k) {"
+            "    try { sessionStorage.setItem(k, ss[k]); } catch (_) {}"
+            "  });"
+            "})(%s, %s);" % (json.dumps(local_entries), json.dumps(session_entries))
+        )
         try:
-            cookies = json.loads(self._cookie_jar.read_text())
-        except (json.JSONDecodeError, OSError):
+            driver.execute_cdp_cmd("Page.enable", {})
+            result = driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": source}
+            )
+            self._seed_script_id = result.get("identifier")
+        except WebDriverException:
+            return False
+        return True
+
+    def _load_cookies(self, driver: webdriver.Chrome, cookies: list) -> None:
+        # One bulk CDP call instead of one WebDriver POST per cookie.
+        try:
+            driver.execute_cdp_cmd(
+                "Network.setCookies", {"cookies": self._cdp_cookie_payload(cookies)}
+            )
             return
+        except WebDriverException:
+            pass
 
         for cookie in cookies:
+            cookie = dict(cookie)  # the cached snapshot is shared; never mutate it
             if "expiry" in cookie:
                 cookie["expiry"] = int(cookie["expiry"])
             try:
@@ -122,13 +554,7 @@ class LakeraAgent:
             except WebDriverException:
                 continue
 
-    def _restore_storage(self, driver: webdriver.Chrome) -> bool:
-        if not self._storage_path or not self._storage_path.exists():
-            return False
-        try:
-            snapshot = json.loads(self._storage_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            return False
+    def _restore_storage(self, driver: webdriver.Chrome, snapshot: dict) -> bool:
         local_entries = snapshot.get("local") or {}
         session_entries = snapshot.get("session") or {}
         script = """
@@ -152,40 +578,104 @@ class LakeraAgent:
         return bool(local_entries or session_entries)
 
     def _capture_storage(self) -> Optional[dict]:
-        script = """
-            const result = { local: {}, session: {} };
-            for (let i = 0; i < localStorage.length; i++) {
-                const key = localStorage.key(i);
-                result.local[key] = localStorage.getItem(key);
-            }
-            for (let i = 0; i < sessionStorage.length; i++) {
-                const key = sessionStorage.key(i);
-                result.session[key] = sessionStorage.getItem(key);
-            }
-            return result;
-        """
         try:
-            snapshot = self._driver.execute_script(script)
+            return self._evaluate_js(self._CAPTURE_STORAGE_EXPR)
         except WebDriverException:
             return None
-        return snapshot
+
+    def _fetch_cookies(self) -> list:
+        # One bulk CDP call instead of the per-cookie WebDriver envelope.
+        # Storage.getCookies returns the fullest cookie schema; older Chrome
+        # builds only expose Network.getAllCookies, and plain get_cookies is
+        # the last resort.
+        for method in ("Storage.getCookies", "Network.getAllCookies"):
+            try:
+                raw = self._driver.execute_cdp_cmd(method, {})
+                return self._normalize_cdp_cookies(raw.get("cookies") or [])
+            except WebDriverException:
+                continue
+        return self._driver.get_cookies()
+
+    @classmethod
+    def _normalize_cdp_cookies(cls, cookies: list) -> list:
+        """Reshape CDP cookie records to the WebDriver-style jar schema."""
+        normalized = []
+        for cookie in cookies:
+            entry = {key: cookie[key] for key in cls._CDP_COOKIE_FIELDS if key in cookie}
+            expires = cookie.get("expires", -1)
+            if expires and expires > 0 and not cookie.get("session"):
+                entry["expiry"] = int(expires)
+            normalized.append(entry)
+        return normalized
 
     def save_cookies(self) -> None:
         if not self._cookie_jar:
             return
-        cookies = self._driver.get_cookies()
-        self._cookie_jar.parent.mkdir(parents=True, exist_ok=True)
-        self._cookie_jar.write_text(json.dumps(cookies), encoding="utf-8")
+        self._ensure_window()
+        cookies = self._fetch_cookies()
+        encoded = _dump_json_bytes(cookies)
+        digest = hashlib.blake2b(encoded).digest()
+        if digest != self._cookie_digest:
+            if not self._cookie_dir_ready:
+                self._cookie_jar.parent.mkdir(parents=True, exist_ok=True)
+                self._cookie_dir_ready = True
+            _write_snapshot(self._cookie_jar, encoded)
+            self._cookie_digest = digest
+        self._cookies_dirty = False
+        self._submissions_since_save = 0
+
+    def _mark_cookies_dirty(self) -> None:
+        """Record that cookies changed; persist only every N submissions."""
+        self._cookies_dirty = True
+        self._submissions_since_save += 1
+        if self._submissions_since_save >= self._save_every:
+            self.save_cookies()
 
     def save_storage(self) -> None:
         if not self._storage_path:
             return
+        self._ensure_window()
         snapshot = self._capture_storage()
         if snapshot is None:
             return
+        encoded = _dump_json_bytes(snapshot)
+        digest = hashlib.blake2b(encoded).digest()
+        if digest == self._storage_digest:
+            return
         try:
-            self._storage_path.parent.mkdir(parents=True, exist_ok=True)
-            self._storage_path.write_text(json.dumps(snapshot), encoding="utf-8")
+            if not self._storage_dir_ready:
+                self._storage_path.parent.mkdir(parents=True, exist_ok=True)
+                self._storage_dir_ready = True
+            delta_path = _storage_delta_path(self._storage_path)
+            ops = (
+                _diff_storage(self._storage_last_saved, snapshot)
+                if self._storage_last_saved is not None
+                else None
+            )
+            try:
+                delta_size = delta_path.stat().st_size
+            except OSError:
+                delta_size = 0
+            if (
+                ops is not None
+                and len(ops) < STORAGE_DELTA_MAX_OPS
+                and delta_size < STORAGE_DELTA_COMPACT_BYTES
+            ):
+                # Few keys changed: append ops instead of rewriting the base.
+                with open(delta_path, "ab") as handle:
+                    for op in ops:
+                        handle.write(_dump_json_bytes(op))
+                        handle.write(b"\n")
+            else:
+                # First save, a large diff, or an oversized delta log: compact
+                # into a fresh base snapshot and drop the log.
+                _write_snapshot(self._storage_path, encoded)
+                try:
+                    os.unlink(delta_path)
+                except OSError:
+                    pass
+            self._storage_digest = digest
+            self._storage_last_saved = snapshot
         except OSError:
             pass
 
@@ -193,7 +683,28 @@ class LakeraAgent:
         if save_state:
             self.save_cookies()
             self.save_storage()
-        self._driver.quit()
+        # Flush but keep the handle: the logger is shared process-wide and may
+        # serve other agents writing to the same path.
+        self.flush_log()
+        if self._debugger_address:
+            # quit() ends the local WebDriver session and stops the spawned
+            # chromedriver service — both leak otherwise on these short runs.
+            # chromedriver never kills a browser it attached to over
+            # debuggerAddress, so the persistent Chrome survives for reuse.
+            try:
+                self._driver.quit()
+            except WebDriverException:
+                pass
+        elif self._share_browser:
+            # Close only this agent's tab; the shared Chrome stays up for the
+            # other agents until shutdown_shared_browser().
+            try:
+                self._ensure_window()
+                self._driver.close()
+            except WebDriverException:
+                pass
+        else:
+            self._driver.quit()
 
     def __enter__(self) -> "LakeraAgent":
         return self
@@ -201,16 +712,92 @@ class LakeraAgent:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.close()
 
+    # No-argument scripts, kept as ready-to-send expressions so hot callers
+    # never rebuild them and Runtime.evaluate can run them without Selenium's
+    # function-wrapping layer.
+    _ANSWER_TEXT_EXPR = (
+        "(function() {"
+        " var a = document.querySelectorAll('p.answer');"
+        " return a.length ? a[a.length - 1].innerText.trim() : null;"
+        "})()"
+    )
+    _PASSWORD_ALERT_TEXT_EXPR = (
+        "(function() {"
+        " var alerts = document.querySelectorAll('div.customAlert');"
+        " for (var i = alerts.length - 1; i >= 0; i--) {"
+        "   var text = alerts[i].innerText.trim();"
+        "   if (text) return text;"
+        " }"
+        " return null;"
+        "})()"
+    )
+    _CAPTURE_STORAGE_EXPR = (
+        "(function() {"
+        " var snap = function(s) { return Object.fromEntries("
+        "   Array.from({length: s.length}, function(_, i) {"
+        "     var k = s.key(i);"
+        "     return [k, s.getItem(k)];"
+        "   })"
+        " ); };"
+        " return { local: snap(localStorage), session: snap(sessionStorage) };"
+        "})()"
+    )
+
+    _DESCRIPTION_EXPR = (
+        "(function() {"
+        " var d = document.querySelector('p.description');"
+        " return d ? d.innerText.trim() : null;"
+        "})()"
+    )
+
+    # Answer and validation-error text in one round-trip, for the call sites
+    # that need both.
+    _DOM_SNAPSHOT_EXPR = (
+        "(function() {"
+        " var a = document.querySelectorAll('p.answer');"
+        " var e = document.querySelector(\"p.text-red-500, p[class*='text-red']\");"
+        " return {"
+        "   answer: a.length ? a[a.length - 1].innerText.trim() : null,"
+        "   error: e ? e.innerText.trim() : null"
+        " };"
+        "})()"
+    )
+
+    def _dom_snapshot(self) -> dict:
+        try:
+            snapshot = self._evaluate_js(self._DOM_SNAPSHOT_EXPR)
+        except WebDriverException:
+            return {}
+        return snapshot or {}
+
+    def _evaluate_js(self, expression: str):
+        """Run a no-argument JS expression, preferring CDP Runtime.evaluate.
+
+        Runtime.evaluate skips Selenium's script wrapping and argument
+        marshalling, which halves the per-call overhead on paths invoked once
+        per submission. execute_script remains the fallback.
+        """
+        try:
+            result = self._driver.execute_cdp_cmd(
+                "Runtime.evaluate", {"expression": expression, "returnByValue": True}
+            )
+            if not result.get("exceptionDetails"):
+                return (result.get("result") or {}).get("value")
+        except WebDriverException:
+            pass
+        return self._driver.execute_script("return " + expression)
+
     def _find_answer_text(self) -> Optional[str]:
-        answers = self._driver.find_elements(By.CSS_SELECTOR, "p.answer")
-        if not answers:
+        # One script replaces the findElements + getElementText wire
+        # round-trips, which matters inside the polling waits.
+        try:
+            return self._evaluate_js(self._ANSWER_TEXT_EXPR)
+        except WebDriverException:
             return None
-        return answers[-1].text.strip()
 
     def _find_prompt_error(self) -> Optional[str]:
-        selectors = "p.text-red-500, p[class*='text-red']"
         try:
-            error = self._driver.find_element(By.CSS_SELECTOR, selectors)
+            error = self._driver.find_element(*_PROMPT_ERROR_LOCATOR)
         except NoSuchElementException:
             return None
         text = error.text.strip()
@@ -236,10 +823,10 @@ class LakeraAgent:
         error: Optional[str] = None,
         extra: Optional[dict] = None,
     ) -> None:
-        if not self._log_path:
+        if self._logger is None:
             return
         entry = {
-            "timestamp": datetime.utcnow().isoformat(timespec="milliseconds") + "Z",
+            "timestamp": _utc_timestamp_ms(),
             "action": action,
             "purpose": request.get("purpose"),
             "request": request,
@@ -249,25 +836,52 @@ class LakeraAgent:
         }
         if extra:
             entry.update(extra)
-        try:
-            self._log_path.parent.mkdir(parents=True, exist_ok=True)
-            with self._log_path.open("a", encoding="utf-8") as handle:
-                handle.write(json.dumps(entry) + "\n")
-        except OSError:
-            pass
+        self._logger.emit(entry)
+
+    def flush_log(self) -> None:
+        if self._logger is not None:
+            self._logger.flush()
 
     def _get_password_alert_text(self) -> Optional[str]:
-        alerts = self._driver.find_elements(By.CSS_SELECTOR, "div.customAlert")
-        if not alerts:
+        # The newest alert is appended at the end of the list; scan it in the
+        # browser so each poll costs one round-trip instead of one per alert.
+        try:
+            return self._evaluate_js(self._PASSWORD_ALERT_TEXT_EXPR)
+        except WebDriverException:
             return None
-        # The newest alert is appended at the end of the list.
-        for alert in reversed(alerts):
-            text = alert.text.strip()
-            if text:
-                return text
-        return None
+
+    # Resolves with the newest non-empty customAlert text; a MutationObserver
+    # fires the callback the moment the alert lands, so the wait is one async
+    # round-trip instead of a poll per interval.
+    _PASSWORD_ALERT_ASYNC_JS = """
+        var done = arguments[arguments.length - 1];
+        function check() {
+            var alerts = document.querySelectorAll('div.customAlert');
+            for (var i = alerts.length - 1; i >= 0; i--) {
+                var text = alerts[i].innerText.trim();
+                if (text) return text;
+            }
+            return null;
+        }
+        var first = check();
+        if (first) { done(first); return; }
+        var observer = new MutationObserver(function() {
+            var hit = check();
+            if (hit) { observer.disconnect(); done(hit); }
+        });
+        observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+    """
 
     def _wait_for_password_alert(self) -> str:
+        try:
+            result = self._driver.execute_async_script(self._PASSWORD_ALERT_ASYNC_JS)
+            if result:
+                return result
+        except TimeoutException as exc:
+            raise LakeraAgentError("timed out waiting for password result") from exc
+        except WebDriverException:
+            pass  # fall back to client-side polling below
+
         def _alert_ready(_: webdriver.Chrome) -> Optional[str]:
             return self._get_password_alert_text()
 
@@ -277,14 +891,16 @@ class LakeraAgent:
             raise LakeraAgentError("timed out waiting for password result") from exc
         return result or ""
 
+    # Button labels that close a password alert without advancing the level.
+    _DISMISSAL_KEYWORDS = ("try again", "ok", "close", "dismiss", "continue")
+
     def _dismiss_password_alerts(self) -> None:
         try:
-            alerts = self._driver.find_elements(By.CSS_SELECTOR, "div.customAlert")
+            alerts = self._driver.find_elements(*_CUSTOM_ALERT_LOCATOR)
         except WebDriverException:
             return
-        dismissal_keywords = ("try again", "ok", "close", "dismiss", "continue")
         for alert in alerts:
-            if self._click_custom_alert_button(dismissal_keywords, alert_override=alert):
+            if self._click_custom_alert_button(self._DISMISSAL_KEYWORDS, alert_override=alert):
                 continue
             try:
                 self._driver.execute_script("arguments[0].remove();", alert)
@@ -296,15 +912,62 @@ class LakeraAgent:
             binary_path = str(self._chrome_binary.expanduser())
             return binary_path
 
+        # The PATH walk only needs to happen once per process; later instances
+        # (e.g. a pool of agents) reuse the class-level result.
+        cached = LakeraAgent._cached_browser_binary
+        if cached:
+            return cached
+
+        # One scandir pass per PATH entry instead of a full which() walk per
+        # candidate (4x the stat calls). Preference order is preserved: the
+        # earliest PATH hit for each candidate is kept, then candidates win
+        # in declaration order.
         candidates = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser")
+        found: dict[str, str] = {}
+        for directory in os.environ.get("PATH", "").split(os.pathsep):
+            if not directory:
+                continue
+            try:
+                with os.scandir(directory) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                continue
+            for binary in candidates:
+                if binary in found or binary not in names:
+                    continue
+                full_path = os.path.join(directory, binary)
+                if os.access(full_path, os.X_OK):
+                    found[binary] = full_path
+            if len(found) == len(candidates):
+                break
         for binary in candidates:
-            path = which(binary)
+            path = found.get(binary)
             if path:
+                LakeraAgent._cached_browser_binary = path
                 return path
 
         raise LakeraAgentError("could not find a Chrome/Chromium binary in PATH")
 
     def _submit_form(self, element: WebElement) -> None:
+        # The element exposes its form directly via .form, so one script
+        # replaces the XPath ancestor lookup, the button lookup, and the click.
+        script = (
+            "var f = arguments[0].form;"
+            "if (!f) return false;"
+            "var b = f.querySelector(\"button[type='submit']\");"
+            "if (b) { b.click(); }"
+            "else if (f.requestSubmit) { f.requestSubmit(); }"
+            "else { f.submit(); }"
+            "return true;"
+        )
+        try:
+            if self._driver.execute_script(script, element):
+                return
+        except WebDriverException:
+            pass
+        self._submit_form_webdriver(element)
+
+    def _submit_form_webdriver(self, element: WebElement) -> None:
         form = element.find_element(By.XPATH, "ancestor::form")
         try:
             submit = form.find_element(By.CSS_SELECTOR, "button[type='submit']")
@@ -325,34 +988,124 @@ class LakeraAgent:
         except WebDriverException:
             form.submit()
 
+    # Resolves once a new answer or a fresh validation error lands in the DOM.
+    # Running the comparison in a MutationObserver means one async round-trip
+    # instead of timeout/poll_interval polling calls.
+    _PROMPT_RESULT_ASYNC_JS = """
+        var prevAnswer = arguments[0];
+        var prevError = arguments[1];
+        var done = arguments[2];
+        function check() {
+            var err = document.querySelector("p.text-red-500, p[class*='text-red']");
+            if (err) {
+                var errText = err.innerText.trim();
+                if (errText && errText !== prevError) return ['error', errText];
+            }
+            var answers = document.querySelectorAll('p.answer');
+            if (!answers.length) return prevAnswer ? null : ['answer', ''];
+            var text = answers[answers.length - 1].innerText.trim();
+            if (!prevAnswer || text !== prevAnswer) return ['answer', text];
+            return null;
+        }
+        var first = check();
+        if (first) { done(first); return; }
+        var observer = new MutationObserver(function() {
+            var hit = check();
+            if (hit) { observer.disconnect(); done(hit); }
+        });
+        observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+    """
+
     def _wait_for_prompt_result(
         self,
         *,
         previous_answer: Optional[str] = None,
         previous_error: Optional[str] = None,
     ) -> tuple[str, str]:
-        def _result_ready(driver: webdriver.Chrome) -> Optional[tuple[str, str]]:
-            error_text = self._find_prompt_error()
+        try:
+            result = self._driver.execute_async_script(
+                self._PROMPT_RESULT_ASYNC_JS, previous_answer, previous_error
+            )
+            if result:
+                return (result[0], result[1])
+        except TimeoutException as exc:
+            raise LakeraAgentError("timed out waiting for prompt result") from exc
+        except WebDriverException:
+            pass  # fall back to client-side polling below
+
+        def _result_ready() -> Optional[tuple[str, str]]:
+            snapshot = self._dom_snapshot()
+            error_text = snapshot.get("error")
             if error_text and error_text != previous_error:
                 return ("error", error_text)
-            text = self._find_answer_text()
+            text = snapshot.get("answer")
             if text is None:
                 return None if previous_answer else ("answer", "")
             if not previous_answer or text != previous_answer:
                 return ("answer", text)
-            return False
+            return None
+
+        # Exponential backoff: tight polling right after submit (answers often
+        # land fast), easing off so a slow level is not hammered with
+        # round-trips for its whole duration.
+        deadline = time.monotonic() + self._timeout
+        delay = 0.05
+        while True:
+            result = _result_ready()
+            if result is not None:
+                return result
+            if time.monotonic() >= deadline:
+                raise LakeraAgentError("timed out waiting for prompt result")
+            time.sleep(delay)
+            delay = min(delay * 2, 0.4)
 
+    # Handles every customAlert in one pass: clicks the first "Next level"
+    # button if present, otherwise dismisses or removes each alert. Returns
+    # whether a next-level click happened so the caller knows to await the
+    # navigation.
+    _RESOLVE_ALERTS_JS = (
+        "var kws = arguments[0];"
+        "var clickedNext = false;"
+        "var alerts = document.querySelectorAll('div.customAlert');"
+        "for (var i = 0; i < alerts.length; i++) {"
+        "  var buttons = alerts[i].querySelectorAll('button');"
+        "  var next = null, dismiss = null;"
+        "  for (var j = 0; j < buttons.length; j++) {"
+        "    var label = buttons[j].innerText.trim().toLowerCase();"
+        "    if (label.indexOf('next level') >= 0) { next = buttons[j]; break; }"
+        "    if (!dismiss && kws.some(function(k) { return label.indexOf(k) >= 0; })) {"
+        "      dismiss = buttons[j];"
+        "    }"
+        "  }"
+        "  if (next && !clickedNext) { next.click(); clickedNext = true; }"
+        "  else if (dismiss) { dismiss.click(); }"
+        "  else { alerts[i].remove(); }"
+        "}"
+        "return clickedNext;"
+    )
+
+    def _resolve_password_alerts(self) -> Optional[str]:
+        """Capture the next-level URL and dismiss leftover alerts in one script."""
+        original_url = self._driver.current_url
         try:
-            result = self._wait.until(_result_ready)
-        except TimeoutException as exc:
-            raise LakeraAgentError("timed out waiting for prompt result") from exc
-        if not result:
-            return ("answer", "")
-        return result
+            clicked_next = self._driver.execute_script(
+                self._RESOLVE_ALERTS_JS, list(self._DISMISSAL_KEYWORDS)
+            )
+        except WebDriverException:
+            next_level_url = self._capture_next_level_url()
+            self._dismiss_password_alerts()
+            return next_level_url
+        if not clicked_next:
+            return None
+        try:
+            self._wait.until(lambda drv: drv.current_url != original_url)
+        except TimeoutException:
+            return None
+        return self._driver.current_url
 
     def _capture_next_level_url(self) -> Optional[str]:
         try:
-            alert = self._driver.find_element(By.CSS_SELECTOR, "div.customAlert")
+            alert = self._driver.find_element(*_CUSTOM_ALERT_LOCATOR)
         except NoSuchElementException:
             return None
         candidates = alert.find_elements(By.TAG_NAME, "button")
@@ -378,25 +1131,58 @@ class LakeraAgent:
         return self._driver.current_url
 
     def describe_level(self, purpose: Optional[str] = None) -> str:
+        self._ensure_window()
         payload = {"purpose": purpose or "describe_level", "url": self._base_url}
         self._navigate_to(self._base_url)
         return self._fetch_level_description("describe_level", payload)
 
     def describe_active_level(self, purpose: Optional[str] = None) -> str:
-        payload = {
-            "purpose": purpose or "describe_active_level",
-            "url": self._driver.current_url if self._driver else None,
-        }
+        self._ensure_window()
+        url = self._driver.current_url if self._driver else None
+        # A level already described this process needs no DOM round-trip.
+        if url:
+            cached = self.level_descriptions.get(url)
+            if cached is not None:
+                return cached
+        payload = {"purpose": purpose or "describe_active_level", "url": url}
         return self._fetch_level_description("describe_active_level", payload)
 
+    def _prefetch_level_description(self) -> None:
+        """Grab the new level's description right after the next-level navigation.
+
+        Best-effort, single round-trip: if the text is already in the DOM, the
+        upcoming describe call skips its wait; if not, the normal path fetches
+        it. A background thread would hide more latency but Selenium's HTTP
+        session is not safe for concurrent commands, so this stays synchronous.
+        """
+        try:
+            text = self._evaluate_js(self._DESCRIPTION_EXPR)
+            if text:
+                self._prefetched_description = (self._driver.current_url, text)
+        except WebDriverException:
+            pass
+
+    def _consume_prefetched_description(self) -> Optional[str]:
+        prefetched, self._prefetched_description = self._prefetched_description, None
+        if not prefetched:
+            return None
+        try:
+            current = self._driver.current_url
+        except WebDriverException:
+            return None
+        url, text = prefetched
+        return text if url == current else None
+
     def _fetch_level_description(self, action: str, payload: dict) -> str:
         for attempt in (1, 2):
             try:
-                self._prepare_level_page()
-                description = self._wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "p.description"))
-                )
-                text = description.text.strip()
+                text = self._consume_prefetched_description()
+                if text is None:
+                    self._prepare_level_page()
+                    description = self._wait.until(
+                        EC.presence_of_element_located(_DESCRIPTION_LOCATOR)
+                    )
+                    text = description.text.strip()
                 constraint = self._find_constraint_text()
                 combined = text
                 extra = None
@@ -404,6 +1190,9 @@ class LakeraAgent:
                     combined = f"{text}\n\nConstraint:\n{constraint}"
                     extra = {"constraint": constraint}
                 self._log_event(action, payload, response=combined, extra=extra)
+                url = self.current_url
+                if url:
+                    self.level_descriptions[url] = combined
                 return combined
             except TimeoutException as exc:
                 if attempt == 2:
@@ -420,13 +1209,11 @@ class LakeraAgent:
         target = driver or self._driver
         if not target:
             raise LakeraAgentError("WebDriver not available for navigation")
-        target.get(url)
-        if not self._page_load_stop_after:
-            return
+        # pageLoadStrategy="eager" makes get() return at DOMContentLoaded, so
+        # there is no readyState polling left to do; a navigation that blows
+        # the page-load timeout is stopped and treated as loaded-enough.
         try:
-            WebDriverWait(target, self._page_load_stop_after).until(
-                lambda drv: drv.execute_script("return document.readyState") == "complete"
-            )
+            target.get(url)
         except TimeoutException:
             self._stop_page_load(driver=target)
 
@@ -442,14 +1229,38 @@ class LakeraAgent:
     def _prepare_level_page(self) -> None:
         # Some levels show custom alert overlays (e.g., "Next level" buttons) that block the DOM
         # after cookies resume a session. Click through them automatically so waits do not hang.
+        # The whole match-and-click loop runs inside the browser: one round-trip
+        # instead of find_element + per-button .text fetches per iteration.
         keywords = ("next level", "continue", "start", "resume", "play")
+        script = (
+            "var kws = arguments[0];"
+            "for (var i = 0; i < 3; i++) {"
+            "  var alert = document.querySelector('div.customAlert');"
+            "  if (!alert) return;"
+            "  var hit = null;"
+            "  var buttons = alert.querySelectorAll('button');"
+            "  for (var j = 0; j < buttons.length; j++) {"
+            "    var label = buttons[j].innerText.trim().toLowerCase();"
+            "    if (kws.some(function(k) { return label.indexOf(k) >= 0; })) {"
+            "      hit = buttons[j]; break;"
+            "    }"
+            "  }"
+            "  if (!hit) return;"
+            "  hit.click();"
+            "}"
+        )
+        try:
+            self._driver.execute_script(script, list(keywords))
+            return
+        except WebDriverException:
+            pass
         for _ in range(3):
             if not self._click_custom_alert_button(keywords):
                 break
 
     def _click_custom_alert_button(self, keywords: Iterable[str], *, alert_override: Optional[WebElement] = None) -> bool:
         try:
-            alert = alert_override or self._driver.find_element(By.CSS_SELECTOR, "div.customAlert")
+            alert = alert_override or self._driver.find_element(*_CUSTOM_ALERT_LOCATOR)
         except NoSuchElementException:
             return False
 
@@ -465,7 +1276,83 @@ class LakeraAgent:
                 return True
         return False
 
+    def _locate_clickable(self, selector: str) -> WebElement:
+        """Locate a form element, reusing the cached handle between submissions.
+
+        The prompt textarea and password input do not change while the level
+        page stays put, so a cache hit replaces the clickable-wait round-trips
+        with one cheap is_enabled() probe. A stale or disabled handle falls
+        through to a fresh lookup.
+        """
+        key = (self._driver.current_url, selector)
+        cached = self._form_cache.get(key)
+        if cached is not None:
+            try:
+                if cached.is_enabled():
+                    return cached
+            except WebDriverException:
+                pass
+            del self._form_cache[key]
+        element = self._wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
+        self._form_cache[key] = element
+        return element
+
+    def _fill_and_submit_prompt(self, prompt_text: str, textarea: WebElement) -> None:
+        # Setting .value and submitting in one script avoids the per-keystroke
+        # send_keys round-trips plus the separate form lookup and click. The
+        # value goes through the native prototype setter: React's value
+        # tracker ignores a direct .value assignment and dedupes the synthetic
+        # event, so a controlled form would otherwise submit its old state.
+        script = (
+            "var t = document.querySelector('textarea#comment');"
+            "if (!t || !t.form) return false;"
+            "Object.getOwnPropertyDescriptor("
+            "  HTMLTextAreaElement.prototype, 'value').set.call(t, arguments[0]);"
+            "t.dispatchEvent(new Event('input', {bubbles: true}));"
+            "var f = t.form;"
+            "var b = f.querySelector(\"button[type='submit']\");"
+            "if (b) { b.click(); }"
+            "else if (f.requestSubmit) { f.requestSubmit(); }"
+            "else { f.submit(); }"
+            "return true;"
+        )
+        try:
+            submitted = self._driver.execute_script(script, prompt_text)
+        except WebDriverException:
+            submitted = False
+        if not submitted:
+            textarea.clear()
+            textarea.send_keys(prompt_text)
+            self._submit_form(textarea)
+
+    def _fill_and_submit_password(self, password_text: str, guess_input: WebElement) -> None:
+        # Same single-script fill as the prompt path: one round-trip instead of
+        # per-keystroke send_keys plus the form lookup and click, with the
+        # native setter so React-controlled inputs register the new value.
+        script = (
+            "var g = document.querySelector('input#guess');"
+            "if (!g || !g.form) return false;"
+            "Object.getOwnPropertyDescriptor("
+            "  HTMLInputElement.prototype, 'value').set.call(g, arguments[0]);"
+            "g.dispatchEvent(new Event('input', {bubbles: true}));"
+            "var f = g.form;"
+            "var b = f.querySelector(\"button[type='submit']\");"
+            "if (b) { b.click(); }"
+            "else if (f.requestSubmit) { f.requestSubmit(); }"
+            "else { f.submit(); }"
+            "return true;"
+        )
+        try:
+            submitted = self._driver.execute_script(script, password_text)
+        except WebDriverException:
+            submitted = False
+        if not submitted:
+            guess_input.clear()
+            guess_input.send_keys(password_text)
+            self._submit_form(guess_input)
+
     def submit_prompt(self, prompt: str, purpose: Optional[str] = None) -> str:
+        self._ensure_window()
         if not prompt.strip():
             raise LakeraAgentError("prompt text cannot be empty")
         sanitized_prompt, changed = self._sanitize_sendable_text(prompt)
@@ -480,16 +1367,13 @@ class LakeraAgent:
             last_wait_error: Optional[LakeraAgentError] = None
             for attempt in range(1, PROMPT_SUBMIT_MAX_ATTEMPTS + 1):
                 self._prepare_level_page()
-                textarea = self._wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "textarea#comment"))
-                )
-                textarea.clear()
+                textarea = self._locate_clickable("textarea#comment")
                 adjusted_prompt = sanitized_prompt if attempt == 1 else sanitized_prompt + "."
-                textarea.send_keys(adjusted_prompt)
-                previous_answer = self._find_answer_text()
-                previous_error = self._find_prompt_error()
+                before = self._dom_snapshot()
+                previous_answer = before.get("answer")
+                previous_error = before.get("error")
                 try:
-                    self._submit_form(textarea)
+                    self._fill_and_submit_prompt(adjusted_prompt, textarea)
                     time.sleep(PROMPT_POST_SUBMIT_DELAY)
                     interim_answer = self._find_answer_text()
                     if interim_answer and (not previous_answer or interim_answer != previous_answer):
@@ -512,13 +1396,17 @@ class LakeraAgent:
                 raise LakeraAgentError("prompt submission failed without specific error")
 
             if result_type == "answer" and not answer.strip():
-                deadline = time.time() + EMPTY_ANSWER_GRACE_SECONDS
-                while time.time() < deadline:
-                    time.sleep(EMPTY_ANSWER_POLL_SECONDS)
+                # Late-arriving text usually lands within tens of ms; back off
+                # from a tight first check instead of fixed 200ms quanta.
+                deadline = time.monotonic() + EMPTY_ANSWER_GRACE_SECONDS
+                delay = 0.02
+                while time.monotonic() < deadline:
+                    time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
                     fresh = self._find_answer_text()
                     if fresh and (not previous_answer or fresh != previous_answer):
                         answer = fresh
                         break
+                    delay = min(delay * 2, EMPTY_ANSWER_POLL_SECONDS * 4)
         except TimeoutException as exc:
             error_message = "timed out waiting for prompt form"
             self._log_event("submit_prompt", payload, error=error_message)
@@ -526,7 +1414,84 @@ class LakeraAgent:
         except LakeraAgentError as exc:
             self._log_event("submit_prompt", payload, error=str(exc))
             raise
-        self.save_cookies()
+        self._mark_cookies_dirty()
+        if result_type == "error":
+            self._last_prompt_error = answer
+            self._log_event("submit_prompt", payload, response=answer, extra={"result_type": "validation_error"})
+        else:
+            self._log_event("submit_prompt", payload, response=answer)
+        return answer
+
+    # Fill, submit and await the result in one async script: the previous
+    # answer/error are snapshotted client-side, the form is submitted, and a
+    # MutationObserver resolves with the fresh result — a single wire
+    # round-trip for the whole submission instead of fill + snapshot + wait.
+    _SUBMIT_PROMPT_FAST_ASYNC_JS = """
+        var text = arguments[0];
+        var done = arguments[1];
+        var t = document.querySelector('textarea#comment');
+        if (!t || !t.form) { done(null); return; }
+        function grab() {
+            var err = document.querySelector("p.text-red-500, p[class*='text-red']");
+            var answers = document.querySelectorAll('p.answer');
+            return [
+                answers.length ? answers[answers.length - 1].innerText.trim() : null,
+                err ? err.innerText.trim() : null
+            ];
+        }
+        var prev = grab();
+        var prevAnswer = prev[0], prevError = prev[1];
+        Object.getOwnPropertyDescriptor(
+            HTMLTextAreaElement.prototype, 'value').set.call(t, text);
+        t.dispatchEvent(new Event('input', {bubbles: true}));
+        var f = t.form;
+        var b = f.querySelector("button[type='submit']");
+        if (b) { b.click(); }
+        else if (f.requestSubmit) { f.requestSubmit(); }
+        else { f.submit(); }
+        function check() {
+            var now = grab();
+            if (now[1] && now[1] !== prevError) return ['error', now[1]];
+            if (now[0] === null) return null;
+            if (!prevAnswer || now[0] !== prevAnswer) return ['answer', now[0]];
+            return null;
+        }
+        var observer = new MutationObserver(function() {
+            var hit = check();
+            if (hit) { observer.disconnect(); done(hit); }
+        });
+        observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+    """
+
+    def submit_prompt_fast(self, prompt: str, purpose: Optional[str] = None) -> str:
+        """Submit a prompt with fill, submit and result-wait in one script call.
+
+        Best-effort fast path for bulk drivers: the whole submission costs a
+        single execute_async_script round-trip. Anything unexpected — missing
+        form, script timeout, empty answer — falls back to the regular
+        submit_prompt path with its retries and grace polling.
+        """
+        self._ensure_window()
+        if not prompt.strip():
+            raise LakeraAgentError("prompt text cannot be empty")
+        sanitized_prompt, changed = self._sanitize_sendable_text(prompt)
+        if not sanitized_prompt.strip():
+            raise LakeraAgentError("prompt became empty after removing unsupported characters")
+        self._last_prompt_error = None
+        try:
+            result = self._driver.execute_async_script(
+                self._SUBMIT_PROMPT_FAST_ASYNC_JS, sanitized_prompt
+            )
+        except (TimeoutException, WebDriverException):
+            result = None
+        if not result or (result[0] == "answer" and not result[1].strip()):
+            return self.submit_prompt(prompt, purpose=purpose)
+        result_type, answer = result[0], result[1]
+        payload = {"purpose": purpose or "prompt", "prompt": sanitized_prompt}
+        if changed:
+            payload["original_prompt"] = prompt
+            payload["sanitized"] = True
+        self._mark_cookies_dirty()
         if result_type == "error":
             self._last_prompt_error = answer
             self._log_event("submit_prompt", payload, response=answer, extra={"result_type": "validation_error"})
@@ -541,6 +1506,7 @@ class LakeraAgent:
             pass
 
     def submit_password(self, password: str, purpose: Optional[str] = None) -> str:
+        self._ensure_window()
         if not password.strip():
             raise LakeraAgentError("password cannot be empty")
         sanitized_password, changed = self._sanitize_sendable_text(password)
@@ -556,9 +1522,7 @@ class LakeraAgent:
             for attempt in range(1, PASSWORD_WARMUP_ATTEMPTS + 1):
                 self._prepare_level_page()
                 try:
-                    guess_input = self._wait.until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, "input#guess"))
-                    )
+                    guess_input = self._locate_clickable("input#guess")
                     break
                 except TimeoutException as exc:
                     last_exc = exc
@@ -570,13 +1534,11 @@ class LakeraAgent:
                 if last_exc:
                     raise last_exc
                 raise LakeraAgentError("password input unavailable")
-            guess_input.clear()
-            guess_input.send_keys(sanitized_password)
-            self._submit_form(guess_input)
+            self._fill_and_submit_password(sanitized_password, guess_input)
             answer = self._wait_for_password_alert()
-            next_level_url = self._capture_next_level_url()
-            self._last_next_level_url = next_level_url
-            self._dismiss_password_alerts()
+            self._last_next_level_url = self._resolve_password_alerts()
+            if self._last_next_level_url:
+                self._prefetch_level_description()
         except TimeoutException as exc:
             error_message = "timed out waiting for password input"
             self._log_event("submit_password", payload, error=error_message)
@@ -584,7 +1546,7 @@ class LakeraAgent:
         except LakeraAgentError as exc:
             self._log_event("submit_password", payload, error=str(exc))
             raise
-        self.save_cookies()
+        self._mark_cookies_dirty()
         extra = {"next_level_url": self._last_next_level_url} if self._last_next_level_url else None
         self._log_event("submit_password", payload, response=answer, extra=extra)
         return answer
@@ -605,3 +1567,48 @@ class LakeraAgent:
     @property
     def last_prompt_error(self) -> Optional[str]:
         return self._last_prompt_error
+
+
+class LakeraAgentPool:
+    """Fixed-size pool of warm LakeraAgent instances for attacking levels in parallel.
+
+    Each LakeraAgent owns a full Chrome process with a 1-2s cold start, so a
+    multi-level run should start them once and hand them out to workers::
+
+        with LakeraAgentPool(4, headless=True) as pool:
+            with pool.acquire() as agent:
+                agent.submit_prompt(...)
+    """
+
+    def __init__(self, size: int, **agent_kwargs) -> None:
+        if size < 1:
+            raise ValueError("pool size must be at least 1")
+        self._size = size
+        self._agents: "queue.Queue[LakeraAgent]" = queue.Queue()
+        # Chrome startup is the dominant cost; warm every agent concurrently.
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            for agent in executor.map(lambda _: LakeraAgent(**agent_kwargs), range(size)):
+                self._agents.put(agent)
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[LakeraAgent]:
+        """Borrow an agent; blocks until one is free. Returns it on exit."""
+        agent = self._agents.get(timeout=timeout)
+        try:
+            yield agent
+        finally:
+            self._agents.put(agent)
+
+    def close(self) -> None:
+        for _ in range(self._size):
+            agent = self._agents.get()
+            try:
+                agent.close()
+            except (LakeraAgentError, WebDriverException, OSError):
+                pass
+
+    def __enter__(self) -> "LakeraAgentPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
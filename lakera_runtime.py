@@ -0,0 +1,93 @@
+"""Keep one Chrome alive across entrypoint runs and attach agents to it.
+
+Launching Chrome dominates the wall time of short runs (seconds per
+invocation, plus profile hydration). This module starts a detached Chrome with
+a remote-debugging port once, and later invocations of main.py / the probe
+scripts attach to it via ``LakeraAgent.attach`` instead of cold-starting.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import threading
+import time
+from pathlib import Path
+from shutil import which
+
+from paths import userdata_paths
+from lakera import LakeraAgent, LakeraAgentError
+
+DEFAULT_USERDATA_DIR = userdata_paths().userdata_dir
+DEBUG_PORT = int(os.getenv("LAKERA_DEBUG_PORT", "9222"))
+CHROME_START_TIMEOUT = float(os.getenv("LAKERA_CHROME_START_TIMEOUT", "15"))
+
+_CHROME_CANDIDATES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser")
+
+
+def _port_open(port: int) -> bool:
+    with socket.socket() as sock:
+        sock.settimeout(0.2)
+        return sock.connect_ex(("127.0.0.1", port)) == 0
+
+
+def _find_chrome() -> str:
+    cached = LakeraAgent._cached_browser_binary
+    if cached:
+        return cached
+    for binary in _CHROME_CANDIDATES:
+        path = which(binary)
+        if path:
+            LakeraAgent._cached_browser_binary = path
+            return path
+    raise LakeraAgentError("could not find a Chrome/Chromium binary in PATH")
+
+
+# Serializes Chrome launches within this process: between Popen and the debug
+# port opening, the port check alone would let a second caller (e.g. the
+# pre-warm thread racing build_agent) launch a duplicate Chrome against the
+# same profile and port.
+_launch_lock = threading.Lock()
+
+
+def ensure_chrome(*, userdata_dir: Path = DEFAULT_USERDATA_DIR, port: int = DEBUG_PORT) -> str:
+    """Return the debugger address of the persistent Chrome, launching it if needed."""
+    address = f"127.0.0.1:{port}"
+    if _port_open(port):
+        return address
+    with _launch_lock:
+        return _launch_chrome(userdata_dir, port, address)
+
+
+def _launch_chrome(userdata_dir: Path, port: int, address: str) -> str:
+    # Re-check under the lock: a concurrent caller may have finished the
+    # launch while this one was waiting.
+    if _port_open(port):
+        return address
+
+    profile_dir = userdata_dir / "chrome-profile"
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    subprocess.Popen(
+        [
+            _find_chrome(),
+            f"--remote-debugging-port={port}",
+            f"--user-data-dir={profile_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + CHROME_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if _port_open(port):
+            return address
+        time.sleep(0.2)
+    raise LakeraAgentError("detached Chrome did not open its debugging port in time")
+
+
+def get_or_attach_agent(**agent_kwargs) -> LakeraAgent:
+    """Attach a LakeraAgent to the persistent Chrome, starting Chrome on first use."""
+    return LakeraAgent.attach(debugger_address=ensure_chrome(), **agent_kwargs)
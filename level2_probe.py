@@ -13,21 +13,26 @@ flow is:
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 import os
+import threading
 from pathlib import Path
 
+from paths import userdata_paths
 from lakera import LakeraAgent, LakeraAgentError
+from utils import flush_output, print_block
 
 DEFAULT_BASE_URL = os.getenv("LAKERA_URL", "https://gandalf.lakera.ai/baseline")
-DEFAULT_USERDATA = Path(os.getenv("USERDATA_DIR", "userdata")).expanduser()
-DEFAULT_COOKIE_JAR = DEFAULT_USERDATA / "cookies.json"
-DEFAULT_STORAGE_PATH = DEFAULT_USERDATA / "lakera-storage.json"
-DEFAULT_LOG_PATH = Path(os.getenv("LAKERA_INTERACTIONS", str(DEFAULT_USERDATA / "interactions.jsonl"))).expanduser()
+DEFAULT_USERDATA = userdata_paths().userdata_dir
+DEFAULT_COOKIE_JAR = userdata_paths().cookie_jar
+DEFAULT_STORAGE_PATH = userdata_paths().storage_path
+DEFAULT_LOG_PATH = userdata_paths().log_path
 DEFAULT_PAGE_STOP = float(os.getenv("LAKERA_PAGE_STOP", "5"))
 
 
-def parse_args() -> argparse.Namespace:
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Open Gandalf level 2 by reusing persisted storage")
     parser.add_argument("--base-url", default=DEFAULT_BASE_URL, help="Level 1 URL to start from")
     parser.add_argument("--prompt", default="Hi Gandalf!", help="Warm-up prompt so the password box appears")
@@ -54,7 +59,17 @@ def parse_args() -> argparse.Namespace:
         default=False,
         help="Run Chrome in headless mode (off by default so you can see the UI)",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--reuse-browser",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Attach to a persistent Chrome (started on first use) instead of launching one per run",
+    )
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    return _build_parser().parse_args()
 
 
 def configure_logging(debug: bool) -> None:
@@ -63,7 +78,7 @@ def configure_logging(debug: bool) -> None:
 
 
 def build_agent(*, base_url: str, args: argparse.Namespace) -> LakeraAgent:
-    return LakeraAgent(
+    agent_kwargs = dict(
         base_url=base_url,
         headless=args.headless,
         cookie_jar=args.cookie_jar,
@@ -72,6 +87,11 @@ def build_agent(*, base_url: str, args: argparse.Namespace) -> LakeraAgent:
         log_path=args.log_path,
         timeout=args.timeout,
     )
+    if args.reuse_browser:
+        from lakera_runtime import get_or_attach_agent
+
+        return get_or_attach_agent(**agent_kwargs)
+    return LakeraAgent(**agent_kwargs)
 
 
 def run_flow(args: argparse.Namespace) -> None:
@@ -79,32 +99,54 @@ def run_flow(args: argparse.Namespace) -> None:
     try:
         with build_agent(base_url=args.base_url, args=args) as level_one_agent:
             description = level_one_agent.describe_level(purpose="level2_probe:level1:describe")
-            print("Level 1 description:\n" + description)
+            print_block("Level 1 description:", description)
             logging.debug("Level 1 description chars=%d", len(description))
 
             warmup = args.prompt.strip()
             if warmup:
-                print("\n> Prompt:\n" + warmup)
+                print_block("\n> Prompt:", warmup)
                 response = level_one_agent.submit_prompt(warmup, purpose="level2_probe:warmup")
-                print("Response:\n" + response)
+                print_block("Response:", response)
 
-            print("\n> Password attempt: " + args.password)
+            print_block("\n> Password attempt: " + args.password)
             password_result = level_one_agent.submit_password(args.password, purpose="level2_probe:password")
-            print("Result:\n" + password_result)
+            print_block("Result:", password_result)
             next_level_url = level_one_agent.last_next_level_url
             if not next_level_url:
                 raise LakeraAgentError("Password accepted but no Next Level URL was captured")
-            print("Next level URL:\n" + next_level_url)
+            print_block("Next level URL:", next_level_url)
 
             logging.info("Level 2 reached inside the same browser session")
             description = level_one_agent.describe_active_level(purpose="level2_probe:level2:describe")
-            print("\nLevel 2 description:\n" + description)
+            print_block("\nLevel 2 description:", description)
     except LakeraAgentError as exc:
         raise SystemExit(f"LakeraAgentError during probe: {exc}")
+    finally:
+        flush_output()
+
+
+def _prewarm_chrome() -> None:
+    """Start the persistent Chrome in the background; errors surface later.
+
+    ensure_chrome serializes launches behind a module-level lock, so
+    build_agent's own call either returns immediately (port already open),
+    blocks until this thread's launch finishes, or performs the launch
+    itself if this thread failed.
+    """
+    from lakera_runtime import ensure_chrome
+
+    try:
+        ensure_chrome()
+    except LakeraAgentError:
+        pass
 
 
 def main() -> None:
     args = parse_args()
+    if args.reuse_browser:
+        # Overlap the Chrome launch with logging setup and the rest of the
+        # pre-flight work instead of paying for it inside build_agent.
+        threading.Thread(target=_prewarm_chrome, daemon=True).start()
     configure_logging(args.debug)
     if args.headless:
         logging.warning("Headless mode is enabled; disable it to observe the UI as requested")
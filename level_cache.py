@@ -0,0 +1,69 @@
+"""Disk cache for Gandalf level descriptions, keyed by level URL.
+
+Level descriptions are static per level, so once fetched they can be served
+from disk instead of reloading the page and waiting on the DOM. Entries live
+in userdata/levels/{blake2b(url)}.txt and are written atomically.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from paths import userdata_paths
+from lakera import LakeraAgent
+
+LEVEL_CACHE_DIR = userdata_paths().level_cache_dir
+
+
+def _cache_path(url: str) -> Path:
+    key = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    return LEVEL_CACHE_DIR / f"{key}.txt"
+
+
+def _read_cached(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding="utf-8")
+    except (FileNotFoundError, OSError):
+        return None
+
+
+def _write_cached(path: Path, description: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(description)
+        os.replace(tmp_name, str(path))
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+
+
+def describe_active_level_cached(
+    agent: LakeraAgent,
+    *,
+    purpose: Optional[str] = None,
+    refresh: bool = False,
+) -> str:
+    """Return the active level's description, serving from disk when possible.
+
+    Keyed by the agent's current URL; falls through to the live fetch when the
+    URL is unknown, on a cache miss, or when ``refresh`` is set (which also
+    rewrites the entry).
+    """
+    url = agent.current_url
+    path = _cache_path(url) if url else None
+    if path is not None and not refresh:
+        cached = _read_cached(path)
+        if cached:
+            return cached
+    description = agent.describe_active_level(purpose=purpose)
+    if path is not None and description:
+        _write_cached(path, description)
+    return description
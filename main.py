@@ -1,16 +1,36 @@
+import json
 import os
 from pathlib import Path
 #from __future__ import annotations
 
 import argparse
+import functools
+from paths import userdata_paths
 from lakera import LakeraAgent, LakeraAgentError
-from claude import ClaudeAgent
-import time
+from level_cache import describe_active_level_cached
+from claude import get_shared_agent
 
-DEFAULT_COOKIE_JAR = Path(os.getenv("USERDATA_DIR", "userdata")).expanduser() / "cookies.json"
+DEFAULT_COOKIE_JAR = userdata_paths().cookie_jar
+KNOWN_PASSWORDS_PATH = userdata_paths().known_passwords
 
 
-def parse_args() -> argparse.Namespace:
+def _load_known_passwords(path: Path = KNOWN_PASSWORDS_PATH) -> dict:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return {}
+
+
+def _save_known_passwords(known: dict, path: Path = KNOWN_PASSWORDS_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(known, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Try submitting a password with LakeraAgent")
     parser.add_argument(
         "--password",
@@ -33,19 +53,53 @@ def parse_args() -> argparse.Namespace:
         default="password_probe",
         help="Label recorded in the JSONL log for these interactions.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--reuse-browser",
+        action="store_true",
+        help="Attach to a persistent Chrome instead of launching one per run.",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached level descriptions and re-fetch them from the page.",
+    )
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    return _build_parser().parse_args()
 
 def main() -> None:
     args = parse_args()
     model = "claude-sonnet-4-5-20250929"
     # model = "claude-haiku-4-5-20251001"
     max_rounds_level = 50
-    claude = ClaudeAgent(model)
+    claude = get_shared_agent(model)
     lever_counter = 0
     try:
-        with LakeraAgent(headless=False, cookie_jar=args.cookie_jar) as lakera:
+        if args.reuse_browser:
+            from lakera_runtime import get_or_attach_agent
+
+            agent_cm = get_or_attach_agent(cookie_jar=args.cookie_jar)
+        else:
+            agent_cm = LakeraAgent(headless=False, cookie_jar=args.cookie_jar)
+        known_passwords = _load_known_passwords()
+        with agent_cm as lakera:
             while True:
-                level_description = lakera.describe_active_level()
+                # Fast path: a password discovered on an earlier run solves the
+                # level without spending any model turns.
+                level_url = lakera.current_url
+                known = known_passwords.get(level_url) if level_url else None
+                if known:
+                    print(f"[main] Trying known password for {level_url}")
+                    check = lakera.submit_password(known)
+                    if check and "You guessed the password!" in check:
+                        lever_counter += 1
+                        print("[lakera] Password check result: " + check)
+                        continue
+                    print("[main] Known password rejected; falling back to the model.")
+
+                level_description = describe_active_level_cached(lakera, refresh=args.refresh)
                 lever_counter += 1
                 print(f"[lakera] Level {lever_counter} description: {level_description}")
 
@@ -72,8 +126,13 @@ def main() -> None:
 
                     claude.process_lakera_output(answer, check)
                     if claude.success:
+                        if level_url and claude.password:
+                            known_passwords[level_url] = claude.password
+                            _save_known_passwords(known_passwords)
                         break
-                    time.sleep(1)
+                    # No pacing sleep: submit_prompt/submit_password already
+                    # block until Lakera has answered, so the loop is naturally
+                    # rate-limited by the page and the model.
                 if not claude.success:
                     print("Max rounds reached, exiting.")
                     exit(0)
@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 from pathlib import Path
 
+from paths import userdata_paths
 from lakera import LakeraAgent, LakeraAgentError
+from utils import flush_output, print_block
 
-DEFAULT_COOKIE_JAR = Path(os.getenv("USERDATA_DIR", "userdata")).expanduser() / "cookies.json"
+DEFAULT_COOKIE_JAR = userdata_paths().cookie_jar
 
 
-def parse_args() -> argparse.Namespace:
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Try submitting a password with LakeraAgent")
     parser.add_argument(
         "--password",
@@ -34,26 +38,44 @@ def parse_args() -> argparse.Namespace:
         default="password_probe",
         help="Label recorded in the JSONL log for these interactions.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--reuse-browser",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Attach to a persistent Chrome instead of launching one per run.",
+    )
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    return _build_parser().parse_args()
 
 
 def main() -> None:
     args = parse_args()
     try:
-        with LakeraAgent(headless=False, cookie_jar=args.cookie_jar) as agent:
-            print("Level description:\n" + agent.describe_level(purpose=f"{args.purpose}:describe"))
+        if args.reuse_browser:
+            from lakera_runtime import get_or_attach_agent
+
+            agent_cm = get_or_attach_agent(cookie_jar=args.cookie_jar)
+        else:
+            agent_cm = LakeraAgent(headless=False, cookie_jar=args.cookie_jar)
+        with agent_cm as agent:
+            print_block("Level description:", agent.describe_level(purpose=f"{args.purpose}:describe"))
             warmup = args.warmup_prompt.strip()
             if warmup:
-                print("\n> Warm-up prompt:\n" + warmup)
+                print_block("\n> Warm-up prompt:", warmup)
                 warm_response = agent.submit_prompt(warmup, purpose=f"{args.purpose}:warmup")
-                print("Response:\n" + warm_response)
-            print("\n> Password attempt:")
+                print_block("Response:", warm_response)
+            print_block("\n> Password attempt:")
             result = agent.submit_password(args.password, purpose=f"{args.purpose}:password")
-            print("Result:\n" + result)
+            print_block("Result:", result)
             if agent.last_next_level_url:
-                print("Next level URL:\n" + agent.last_next_level_url)
+                print_block("Next level URL:", agent.last_next_level_url)
     except LakeraAgentError as exc:
-        print(f"LakeraAgentError: {exc}")
+        print_block(f"LakeraAgentError: {exc}")
+    finally:
+        flush_output()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,37 @@
+"""Once-per-process resolution of the shared userdata paths.
+
+Every entrypoint used to re-derive ``Path(os.getenv("USERDATA_DIR",
+"userdata")).expanduser()`` at import time; expanduser can hit pwd lookups on
+POSIX, so the derivations live behind one cached helper instead.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+
+class UserdataPaths(NamedTuple):
+    userdata_dir: Path
+    cookie_jar: Path
+    storage_path: Path
+    log_path: Path
+    known_passwords: Path
+    level_cache_dir: Path
+
+
+@functools.lru_cache(maxsize=1)
+def userdata_paths() -> UserdataPaths:
+    root = Path(os.getenv("USERDATA_DIR", "userdata")).expanduser()
+    return UserdataPaths(
+        userdata_dir=root,
+        cookie_jar=root / "cookies.json",
+        storage_path=root / "lakera-storage.json",
+        log_path=Path(
+            os.getenv("LAKERA_INTERACTIONS", str(root / "interactions.jsonl"))
+        ).expanduser(),
+        known_passwords=root / "known_passwords.json",
+        level_cache_dir=root / "levels",
+    )
@@ -0,0 +1,18 @@
+"""Small helpers shared by the entrypoint scripts."""
+
+from __future__ import annotations
+
+import sys
+
+
+def print_block(title: str, body: str = "") -> None:
+    """Write a titled output block to stdout without forcing a flush.
+
+    One buffered write per block instead of print()'s per-call locking and
+    line-buffered flushing; callers flush once per flow via flush_output().
+    """
+    sys.stdout.write(f"{title}\n{body}\n" if body else f"{title}\n")
+
+
+def flush_output() -> None:
+    sys.stdout.flush()